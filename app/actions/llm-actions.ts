@@ -2,19 +2,36 @@
 "use server";
 
 import { sendChatMessage as sendLLMChatMessage } from "@/services/api-service";
+import { BaseAppError } from "@/lib/error-system";
 import { saveConversation as saveConv, updateConversation as updateConv } from "@/services/conversation-storage";
 import type { ChatMessage, StreamChatOptions } from "@/services/api-service";
 import type { Conversation, ConversationData } from "@/types/app";
 
+// Failures are returned to the browser as messages, so only user-facing text
+// goes out; sendChatMessage has already logged the full error.
+function toClientErrorMessage(reason: unknown): string {
+  return reason instanceof BaseAppError ? reason.userMessage : "Request failed. Please try again.";
+}
+
 export async function sendPrompt(provider: string, messages: ChatMessage[], options: StreamChatOptions) {
   return await sendLLMChatMessage(provider, messages, options);
 }
 
 export async function sendMultiPrompt(providers: string[], messages: ChatMessage[], options: StreamChatOptions) {
-  const responses = await Promise.all(
+  // Results line up with `providers` by index; one failing provider must not sink the others
+  const results = await Promise.allSettled(
     providers.map(provider => sendLLMChatMessage(provider, messages, options))
   );
-  return responses;
+  return results.map((result, index): ChatMessage =>
+    result.status === "fulfilled"
+      ? result.value
+      : {
+          role: "assistant",
+          content: `Error: ${toClientErrorMessage(result.reason)}`,
+          timestamp: Date.now(),
+          metadata: { provider: providers[index], error: true },
+        }
+  );
 }
 
 export async function saveConversation(type: Conversation['type'], title: string, data: ConversationData<Conversation['type']>) {
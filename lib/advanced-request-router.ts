@@ -286,19 +286,44 @@ class AdvancedRequestRouter {
   ): ProviderEndpoint | null {
     if (endpoints.length === 0) return null;
 
-    // Sort by current capacity utilization
-    const sortedEndpoints = [...endpoints].sort((a, b) => {
-      // Prioritize healthy endpoints
-      if (a.healthStatus !== b.healthStatus) {
-        if (a.healthStatus === 'healthy') return -1;
-        if (b.healthStatus === 'healthy') return 1;
+    if (endpoints.length === 1) return endpoints[0];
+
+    // Power of two choices: compare two distinct random endpoints and keep the
+    // less utilized one, preferring a healthy sample over a degraded one. Only
+    // when both samples are degraded are the endpoints scanned for healthy ones.
+    const [a, b] = this.sampleTwo(endpoints);
+    const aHealthy = a.healthStatus === 'healthy';
+    const bHealthy = b.healthStatus === 'healthy';
+
+    if (aHealthy !== bHealthy) {
+      return aHealthy ? a : b;
+    }
+    if (!aHealthy) {
+      const healthyEndpoints = endpoints.filter(e => e.healthStatus === 'healthy');
+      if (healthyEndpoints.length === 1) return healthyEndpoints[0];
+      if (healthyEndpoints.length > 1) {
+        return this.lessUtilized(...this.sampleTwo(healthyEndpoints));
       }
+    }
 
-      // Then by utilization
-      return a.capacity.utilizationPercent - b.capacity.utilizationPercent;
-    });
+    return this.lessUtilized(a, b);
+  }
 
-    return sortedEndpoints[0];
+  /**
+   * Pick two distinct endpoints at random (requires at least two)
+   */
+  private sampleTwo(endpoints: ProviderEndpoint[]): [ProviderEndpoint, ProviderEndpoint] {
+    const first = Math.floor(Math.random() * endpoints.length);
+    let second = Math.floor(Math.random() * (endpoints.length - 1));
+    if (second >= first) second++;
+    return [endpoints[first], endpoints[second]];
+  }
+
+  /**
+   * Less utilized of two endpoints; ties go to the first
+   */
+  private lessUtilized(a: ProviderEndpoint, b: ProviderEndpoint): ProviderEndpoint {
+    return a.capacity.utilizationPercent <= b.capacity.utilizationPercent ? a : b;
   }
 
   /**
@@ -2,6 +2,9 @@ import { deriveKey, aesGcmEncrypt, aesGcmDecrypt } from './crypto';
 import prisma from './prisma';
 import logger from './logger';
 
+// Key derivation memoized per seed; the env var is still read on every call so a changed seed takes effect
+let cachedEncryptionKey: { seed: string; key: Promise<Uint8Array> } | null = null;
+
 // Server-side encryption key from environment
 const getEncryptionKey = async (): Promise<Uint8Array> => {
   const seed =
@@ -9,7 +12,15 @@ const getEncryptionKey = async (): Promise<Uint8Array> => {
   if (!seed || seed.length < 32) {
     throw new Error('API_KEY_ENCRYPTION_SEED must be at least 32 characters long');
   }
-  return await deriveKey(seed);
+  if (!cachedEncryptionKey || cachedEncryptionKey.seed !== seed) {
+    const key = deriveKey(seed).catch((error) => {
+      // Only drop our own entry; a newer seed may have replaced it meanwhile
+      if (cachedEncryptionKey?.key === key) cachedEncryptionKey = null;
+      throw error;
+    });
+    cachedEncryptionKey = { seed, key };
+  }
+  return cachedEncryptionKey.key;
 };
 
 export interface ProviderConfig {
@@ -1,4 +1,5 @@
 import Redis from 'ioredis';
+import { createHash } from 'crypto';
 import { getValidatedEnv, isProduction } from './env';
 import { monitoring } from './monitoring';
 import { auditLogger } from './audit-logger';
@@ -48,7 +49,7 @@ export interface CacheLayer {
   invalidateByTag(tag: string): Promise<number>;
 }
 
-class MemoryCache implements CacheLayer {
+export class MemoryCache implements CacheLayer {
   public readonly name = 'memory';
   private cache = new Map<string, CacheEntry>();
   private stats: CacheStats = {
@@ -95,6 +96,10 @@ class MemoryCache implements CacheLayer {
       // Update access statistics
       entry.accessCount++;
       entry.lastAccessed = Date.now();
+
+      // Re-insert so Map iteration order tracks recency (least recent first)
+      this.cache.delete(key);
+      this.cache.set(key, entry);
       
       this.stats.hits++;
       this.updateHitRate();
@@ -108,8 +113,8 @@ class MemoryCache implements CacheLayer {
 
   async set<T>(key: string, value: T, ttl?: number): Promise<boolean> {
     try {
-      // Evict if at capacity
-      if (this.cache.size >= this.maxSize) {
+      // Evict if at capacity; overwriting an existing key never grows the map
+      if (this.cache.size >= this.maxSize && !this.cache.has(key)) {
         this.evictOldest();
       }
 
@@ -121,6 +126,8 @@ class MemoryCache implements CacheLayer {
         lastAccessed: Date.now()
       };
 
+      // Delete first so an overwritten key moves to the most-recent end
+      this.cache.delete(key);
       this.cache.set(key, entry);
       this.stats.sets++;
       this.stats.size = this.cache.size;
@@ -164,23 +171,12 @@ class MemoryCache implements CacheLayer {
   }
 
   private evictOldest(): void {
-    if (this.cache.size === 0) return;
-
-    // LRU eviction - remove least recently accessed
-    let oldestKey: string | null = null;
-    let oldestTime = Date.now();
-
-    for (const [key, entry] of this.cache.entries()) {
-      if (entry.lastAccessed < oldestTime) {
-        oldestTime = entry.lastAccessed;
-        oldestKey = key;
-      }
-    }
+    // LRU eviction - the first key in iteration order is the least recently used
+    const oldest = this.cache.keys().next();
+    if (oldest.done) return;
 
-    if (oldestKey) {
-      this.cache.delete(oldestKey);
-      this.stats.evictions++;
-    }
+    this.cache.delete(oldest.value);
+    this.stats.evictions++;
   }
 
   private cleanup(): void {
@@ -626,7 +622,6 @@ export async function cacheKey(prefix: string, ...parts: string[]): Promise<stri
   const key = `${prefix}:${parts.join(':')}`;
   // Hash long keys to avoid issues
   if (key.length > 250) {
-    const { createHash } = await import('crypto');
     return `${prefix}:${createHash('sha256').update(key).digest('hex')}`;
   }
   return key;
@@ -34,6 +34,7 @@ export class ConfigurationManager {
   private config: SystemConfig | null = null
   private lastFetch: Date | null = null
   private readonly cacheTimeout = 5 * 60 * 1000 // 5 minutes
+  private defaultsValidated = false
 
   private constructor() {}
 
@@ -72,7 +73,7 @@ export class ConfigurationManager {
 
   private async loadSystemConfig(): Promise<SystemConfig> {
     // Try to load from environment or database
-    const defaultConfig = {
+    const defaultConfig: SystemConfig = {
       providers: {},
       features: {
         streaming: true,
@@ -96,6 +97,12 @@ export class ConfigurationManager {
       lastUpdated: new Date(),
     }
 
+    // The built-in defaults are trusted, so only run the full schema once per
+    // process; external input still goes through validateSystemConfig
+    if (this.defaultsValidated) {
+      return defaultConfig
+    }
+
     const result = configSchema.safeParse(defaultConfig)
     if (!result.success) {
       throw new ConfigurationError(
@@ -105,6 +112,7 @@ export class ConfigurationManager {
       )
     }
 
+    this.defaultsValidated = true
     return result.data
   }
 
@@ -26,6 +26,7 @@ interface PendingQuery {
   priority: 'low' | 'medium' | 'high';
   timeout: number;
   createdAt: number;
+  timer?: NodeJS.Timeout;
 }
 
 interface ConnectionPool {
@@ -49,7 +50,7 @@ class DatabaseConnectionMultiplexer {
   private pool!: ConnectionPool;
   private queryQueue: PendingQuery[] = [];
   private batchQueue: QueryBatch[] = [];
-  private processing = false;
+  private processingTimer: NodeJS.Timeout | null = null;
   private stats: MultiplexerStats = {
     totalQueries: 0,
     batchedQueries: 0,
@@ -71,7 +72,6 @@ class DatabaseConnectionMultiplexer {
 
   constructor() {
     this.initializePool();
-    this.startBackgroundProcessing();
     this.startMetricsReporting();
   }
 
@@ -134,8 +134,10 @@ class DatabaseConnectionMultiplexer {
     }
 
     // Create new connection if under limit
+    // createConnection parks the new client in `available`; take it back out
     if (this.pool.totalConnections < this.pool.maxConnections) {
-      return this.createConnection();
+      this.createConnection();
+      return this.pool.available.pop()!;
     }
 
     // Wait for connection to become available
@@ -166,6 +168,11 @@ class DatabaseConnectionMultiplexer {
 
     // Update connection utilization metrics
     this.updateConnectionMetrics();
+
+    // Queries may be waiting on pool capacity
+    if (this.queryQueue.length > 0) {
+      this.scheduleProcessing();
+    }
   }
 
   /**
@@ -193,6 +200,7 @@ class DatabaseConnectionMultiplexer {
       // Add to queue with priority insertion
       this.insertQueryWithPriority(query);
       this.stats.totalQueries++;
+      this.scheduleProcessing();
 
       logger.debug('query_queued', {
         queryId,
@@ -201,9 +209,9 @@ class DatabaseConnectionMultiplexer {
         queueLength: this.queryQueue.length
       });
 
-      // Set timeout for query
-      setTimeout(() => {
-        const index = this.queryQueue.findIndex(q => q.id === queryId);
+      // Set timeout for query; cleared once the query leaves the queue
+      query.timer = setTimeout(() => {
+        const index = this.queryQueue.indexOf(query);
         if (index >= 0) {
           this.queryQueue.splice(index, 1);
           reject(new Error(`Query timeout after ${timeout}ms`));
@@ -246,36 +254,59 @@ class DatabaseConnectionMultiplexer {
   }
 
   /**
-   * Start background query processing
+   * Schedule a batch dispatch: right away once a full batch is waiting,
+   * otherwise after a short window so more queries can join
    */
-  private startBackgroundProcessing(): void {
-    setInterval(() => {
-      if (!this.processing && this.queryQueue.length > 0) {
-        this.processBatch();
+  private scheduleProcessing(): void {
+    if (this.queryQueue.length >= this.BATCH_SIZE) {
+      if (this.processingTimer) {
+        clearTimeout(this.processingTimer);
+        this.processingTimer = null;
       }
-    }, this.PROCESSING_INTERVAL);
+      queueMicrotask(() => this.processBatch());
+      return;
+    }
+
+    if (!this.processingTimer) {
+      this.processingTimer = setTimeout(() => {
+        this.processingTimer = null;
+        this.processBatch();
+      }, this.PROCESSING_INTERVAL);
+    }
+  }
+
+  /**
+   * Connections that can be handed out right now without waiting
+   */
+  private getConnectionCapacity(): number {
+    return this.pool.available.length + (this.pool.maxConnections - this.pool.totalConnections);
   }
 
   /**
    * Process batch of queries
    */
   private async processBatch(): Promise<void> {
-    if (this.processing || this.queryQueue.length === 0) {
+    // Carving the batch is synchronous, so no flag is needed to keep ticks
+    // from sharing queries. Batches are only bounded by free connections;
+    // waiting on a running batch would serialize every DB round-trip.
+    const capacity = this.getConnectionCapacity();
+    if (this.queryQueue.length === 0 || capacity === 0) {
       return;
     }
 
-    this.processing = true;
-
-    try {
-      // Create batch from queued queries
-      const batchSize = Math.min(this.BATCH_SIZE, this.queryQueue.length, this.pool.available.length || 1);
-      const queries = this.queryQueue.splice(0, batchSize);
+    const batchSize = Math.min(this.BATCH_SIZE, this.queryQueue.length, capacity);
+    const queries = this.queryQueue.splice(0, batchSize);
+    for (const query of queries) {
+      clearTimeout(query.timer);
+    }
 
-      if (queries.length === 0) {
-        return;
-      }
+    if (this.queryQueue.length > 0) {
+      this.scheduleProcessing();
+    }
 
-      const batch: QueryBatch = {
+    let batch: QueryBatch | undefined;
+    try {
+      batch = {
         id: this.generateBatchId(),
         queries,
         createdAt: Date.now(),
@@ -293,16 +324,25 @@ class DatabaseConnectionMultiplexer {
         estimatedTime: batch.estimatedExecutionTime
       });
 
-      // Execute batch
       await this.executeBatch(batch);
-
     } catch (error) {
       logger.error('batch_processing_error', {
+        batchId: batch?.id,
         error: error instanceof Error ? error.message : 'Unknown error',
         queueLength: this.queryQueue.length
       });
+
+      // The queries have left the queue; settle any still pending so callers
+      // don't hang (rejecting an already-settled query is a no-op)
+      const failure = error instanceof Error ? error : new Error('Batch processing failed');
+      for (const query of queries) {
+        query.reject(failure);
+      }
     } finally {
-      this.processing = false;
+      const index = batch ? this.batchQueue.indexOf(batch) : -1;
+      if (index !== -1) {
+        this.batchQueue.splice(index, 1);
+      }
     }
   }
 
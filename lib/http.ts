@@ -31,8 +31,27 @@ type RetryableFetchOptions = RequestInit & {
   retryDelayMs?: number
 }
 
+const RETRYABLE_STATUSES = new Set([408, 425, 429, 500, 502, 503, 504])
+// Statuses where Retry-After tells the client when to come back
+const RETRY_AFTER_STATUSES = new Set([429, 503])
+const MAX_RETRY_AFTER_MS = 10_000
+
 function isRetryableStatus(status: number): boolean {
-  return [408, 425, 429, 500, 502, 503, 504].includes(status)
+  return RETRYABLE_STATUSES.has(status)
+}
+
+// Retry-After may be given in seconds or as an HTTP date
+export function retryAfterMs(response: Response): number | null {
+  const header = response.headers.get('retry-after')
+  if (!header) {
+    return null
+  }
+  const seconds = Number(header)
+  if (Number.isFinite(seconds)) {
+    return Math.max(0, seconds * 1000)
+  }
+  const date = Date.parse(header)
+  return Number.isNaN(date) ? null : Math.max(0, date - Date.now())
 }
 
 const delay = (ms: number) => new Promise<void>(resolve => setTimeout(resolve, ms))
@@ -46,7 +65,14 @@ export async function fetchWithRetry(input: string | URL, init: RetryableFetchOp
     try {
       const response = await fetch(input, requestInit)
       if (!response.ok && attempt < retries && isRetryableStatus(response.status)) {
-        await delay(retryDelayMs * Math.max(1, attempt + 1))
+        const retryAfter = RETRY_AFTER_STATUSES.has(response.status) ? retryAfterMs(response) : null
+        if (retryAfter !== null && retryAfter > MAX_RETRY_AFTER_MS) {
+          return response
+        }
+        const waitMs = retryAfter ?? retryDelayMs * Math.max(1, attempt + 1)
+        // Release the unconsumed body before retrying
+        await response.body?.cancel().catch(() => undefined)
+        await delay(waitMs)
         attempt += 1
         continue
       }
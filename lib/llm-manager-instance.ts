@@ -5,16 +5,24 @@
 
 import { LLMManager, Provider, ProviderOptions, ProviderResponse } from '@/src/core/llm_manager';
 import { providerRegistry } from '@/services/llm-providers/registry';
+import type { ILLMProvider } from '@/services/llm-providers/base-provider';
+
+type ProviderFactory = ReturnType<typeof providerRegistry.getAll>[number];
 
 /**
  * Provider adapter that wraps our existing provider services
  * to match the LLM Manager's Provider interface
  */
 class ProviderAdapter implements Provider {
+  // Bound once at registration so each request skips the registry lookup
+  private readonly getInstance: (apiKey: string) => Promise<ILLMProvider>;
+
   constructor(
     public id: string,
-    private providerService: any
-  ) {}
+    factory: ProviderFactory
+  ) {
+    this.getInstance = factory.getInstance;
+  }
 
   async sendMessage(input: string, options?: ProviderOptions & Record<string, any>): Promise<ProviderResponse> {
     const apiKey = options?.['apiKey'] as string | undefined;
@@ -34,9 +42,12 @@ class ProviderAdapter implements Provider {
       stream: options?.stream,
     };
 
+    // Instances are cached per API key by the registry factories
+    const providerService = await this.getInstance(apiKey);
+
     if (options?.stream) {
       // Return streaming generator
-      const generator = this.providerService.streamChat(request, apiKey);
+      const generator = providerService.streamChat(request, apiKey);
       return {
         stream: (async function* () {
           for await (const chunk of generator) {
@@ -48,7 +59,7 @@ class ProviderAdapter implements Provider {
       };
     } else {
       // Return non-streaming response
-      const response = await this.providerService.chat(request, apiKey);
+      const response = await providerService.chat(request, apiKey);
       return { text: response.content };
     }
   }
@@ -63,9 +74,8 @@ function createLLMManager(): LLMManager {
   // Register all available providers
   const providers = providerRegistry.getAll();
 
-  for (const providerService of providers) {
-    const metadata = providerService.metadata;
-    const adapter = new ProviderAdapter(metadata.id, providerService);
+  for (const factory of providers) {
+    const adapter = new ProviderAdapter(factory.metadata.id, factory);
     manager.registerProvider(adapter);
   }
 
@@ -4,6 +4,15 @@ import { errorManager, LLMProviderError, ValidationError } from '@/lib/error-sys
 import { hasValidApiKey } from '@/lib/api-key-service';
 import logger from '@/lib/logger';
 
+// Fixed at build time; shared rather than re-allocated on every lookup
+const AVAILABLE_PROVIDERS: readonly string[] = Object.freeze([
+  'openai',
+  'anthropic',
+  'google-ai',
+  'openrouter',
+  'grok'
+]);
+
 interface LLMManagerOptions {
   userId?: string;
   teamId?: string;
@@ -63,7 +72,7 @@ export class LLMManager {
       }
 
       // Record start time for metrics
-      const startTime = Date.now();
+      const startTime = performance.now();
 
       // Prepare options for provider
       const providerOptions = {
@@ -91,7 +100,7 @@ export class LLMManager {
         userId: options?.userId,
         teamId: options?.teamId,
         requestId,
-        duration: Date.now() - startTime
+        duration: performance.now() - startTime
       });
 
       // Return the collected response
@@ -184,7 +193,7 @@ export class LLMManager {
       }
 
       // Record start time for metrics
-      const startTime = Date.now();
+      const startTime = performance.now();
 
       // For non-streaming, we'll create a temporary stream and collect the result
       const providerOptions = {
@@ -211,7 +220,7 @@ export class LLMManager {
         userId: options?.userId,
         teamId: options?.teamId,
         requestId,
-        duration: Date.now() - startTime,
+        duration: performance.now() - startTime,
         responseLength: fullResponse.length
       });
 
@@ -274,14 +283,8 @@ export class LLMManager {
   /**
    * Get list of available providers
    */
-  getAvailableProviders(): string[] {
-    return [
-      'openai',
-      'anthropic',
-      'google-ai',
-      'openrouter',
-      'grok'
-    ];
+  getAvailableProviders(): readonly string[] {
+    return AVAILABLE_PROVIDERS;
   }
 
   /**
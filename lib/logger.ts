@@ -9,7 +9,14 @@ interface LogEntry {
   metadata?: Record<string, any>;
 }
 
+// Keyed by the lower-case LOG_LEVEL names from lib/env.ts; the threshold is
+// resolved once so filtered calls return before building or serializing the entry.
+const LEVELS: Record<string, number> = { debug: 20, info: 30, warn: 40, error: 50 };
+const minLevel = LEVELS[(process.env.LOG_LEVEL || 'info').toLowerCase()] ?? LEVELS.info;
+
 function log(level: LogLevel, message: string, metadata?: Record<string, any>) {
+  if (LEVELS[level.toLowerCase()] < minLevel) return;
+
   const entry: LogEntry = {
     timestamp: new Date().toISOString(),
     level,
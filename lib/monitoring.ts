@@ -23,6 +23,12 @@ export interface HealthCheckResult {
   metadata?: Record<string, any>;
 }
 
+interface HealthReport {
+  status: 'healthy' | 'degraded' | 'unhealthy';
+  checks: HealthCheckResult[];
+  timestamp: Date;
+}
+
 export interface SystemMetrics {
   timestamp: Date;
   memory: {
@@ -42,6 +48,7 @@ export interface SystemMetrics {
 class EnterpriseMonitoring {
   private static instance: EnterpriseMonitoring;
   private static readonly HISTORY_RETENTION_MS = 60 * 60 * 1000; // 1 hour
+  private static readonly HEALTH_CHECK_TTL_MS = 5 * 1000; // 5 seconds
 
   private metrics: Map<string, MetricData[]> = new Map();
   private requestCount = 0;
@@ -49,6 +56,7 @@ class EnterpriseMonitoring {
   private responseTimes: number[] = [];
   private startTime = Date.now();
   private healthChecks: Map<string, () => Promise<HealthCheckResult>> = new Map();
+  private healthReport: { report: Promise<HealthReport>; checkedAt: number } | null = null;
   private timers = new Map<string, { startedAt: bigint; metadata?: Record<string, any> }>();
   private requestHistory: Array<{
     timestamp: number;
@@ -395,6 +403,7 @@ class EnterpriseMonitoring {
     this.errorCount = 0;
     this.responseTimes = [];
     this.timers.clear();
+    this.healthReport = null;
   }
 
   /**
@@ -405,45 +414,79 @@ class EnterpriseMonitoring {
     checker: () => Promise<HealthCheckResult>
   ): void {
     this.healthChecks.set(name, checker);
+    this.healthReport = null;
   }
 
   /**
-   * Run all health checks
+   * Run a single health check with a timeout
    */
-  public async runHealthChecks(): Promise<{
-    status: 'healthy' | 'degraded' | 'unhealthy';
-    checks: HealthCheckResult[];
-    timestamp: Date;
-  }> {
-    const checks: HealthCheckResult[] = [];
-    let overallStatus: 'healthy' | 'degraded' | 'unhealthy' = 'healthy';
+  private async runHealthCheck(
+    name: string,
+    checker: () => Promise<HealthCheckResult>
+  ): Promise<HealthCheckResult> {
+    const startTime = Date.now();
+    let timer: NodeJS.Timeout | undefined;
+
+    try {
+      const result = await Promise.race([
+        checker(),
+        new Promise<HealthCheckResult>((_, reject) => {
+          timer = setTimeout(() => reject(new Error('Health check timeout')), 5000);
+        })
+      ]);
+
+      result.responseTime = Date.now() - startTime;
+      return result;
+    } catch (error) {
+      return {
+        name,
+        status: 'unhealthy',
+        message: error instanceof Error ? error.message : 'Unknown error',
+        responseTime: Date.now() - startTime
+      };
+    } finally {
+      clearTimeout(timer);
+    }
+  }
 
-    for (const [name, checker] of this.healthChecks) {
-      try {
-        const startTime = Date.now();
-        const result = await Promise.race([
-          checker(),
-          new Promise<HealthCheckResult>((_, reject) =>
-            setTimeout(() => reject(new Error('Health check timeout')), 5000)
-          )
-        ]);
-        
-        result.responseTime = Date.now() - startTime;
-        checks.push(result);
+  /**
+   * Run all health checks, reusing a report started within the last few seconds
+   */
+  public async runHealthChecks(forceRefresh = false): Promise<HealthReport> {
+    // Polled dashboards share one probe of the database and Redis; the
+    // in-flight promise is cached too, so concurrent callers don't stack up
+    const cached = this.healthReport;
+    if (
+      !forceRefresh &&
+      cached &&
+      Date.now() - cached.checkedAt < EnterpriseMonitoring.HEALTH_CHECK_TTL_MS
+    ) {
+      return cached.report;
+    }
 
-        if (result.status === 'unhealthy') {
-          overallStatus = 'unhealthy';
-        } else if (result.status === 'degraded' && overallStatus === 'healthy') {
-          overallStatus = 'degraded';
-        }
-      } catch (error) {
-        checks.push({
-          name,
-          status: 'unhealthy',
-          message: error instanceof Error ? error.message : 'Unknown error',
-          responseTime: 5000
-        });
+    const report = this.executeHealthChecks().catch((error) => {
+      if (this.healthReport?.report === report) {
+        this.healthReport = null;
+      }
+      throw error;
+    });
+    this.healthReport = { report, checkedAt: Date.now() };
+    return report;
+  }
+
+  private async executeHealthChecks(): Promise<HealthReport> {
+    // Checks are independent, so run them concurrently; each is still bounded
+    // by the same timeout, and its timer is cleared as soon as it settles.
+    const checks = await Promise.all(
+      Array.from(this.healthChecks, ([name, checker]) => this.runHealthCheck(name, checker))
+    );
+
+    let overallStatus: 'healthy' | 'degraded' | 'unhealthy' = 'healthy';
+    for (const check of checks) {
+      if (check.status === 'unhealthy') {
         overallStatus = 'unhealthy';
+      } else if (check.status === 'degraded' && overallStatus === 'healthy') {
+        overallStatus = 'degraded';
       }
     }
 
@@ -111,9 +111,14 @@ let filesProcessed = 0;
 
 Object.entries(fileMap).forEach(([file, fileWarnings]) => {
   const fullPath = path.join(projectRoot, file);
-  if (!fs.existsSync(fullPath)) return;
-  
-  let content = fs.readFileSync(fullPath, 'utf-8');
+  // Read directly and treat a missing file as "skip" instead of stat-then-read
+  let content;
+  try {
+    content = fs.readFileSync(fullPath, 'utf-8');
+  } catch (error) {
+    if (error.code === 'ENOENT') return;
+    throw error;
+  }
   let modified = false;
   
   // Group by rule type
@@ -88,9 +88,8 @@ function prepareRollbackStrategy(dbType) {
   console.log('\n🔄 Preparing rollback strategy...');
   
   const backupDir = path.join(process.cwd(), '.database-backups');
-  if (!fs.existsSync(backupDir)) {
-    fs.mkdirSync(backupDir, { recursive: true });
-  }
+  // recursive mkdir is a no-op when the directory exists, so no separate existence check
+  fs.mkdirSync(backupDir, { recursive: true });
   
   const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
   const backupPath = path.join(backupDir, `backup-${timestamp}.sql`);
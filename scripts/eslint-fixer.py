@@ -4,6 +4,7 @@ Systematic ESLint Warning Fixer
 Fixes all unused vars, unused imports, and no-explicit-any warnings
 """
 
+import functools
 import re
 import sys
 from pathlib import Path
@@ -27,27 +28,52 @@ def add_eslint_disable_any(line: str) -> tuple[str, str]:
     comment = ' ' * indent + '// eslint-disable-line @typescript-eslint/no-explicit-any\n'
     return (line.rstrip() + comment, '')
 
-def remove_unused_import(lines: list[str], import_name: str, line_num: int) -> list[str]:
-    """Remove unused import from import statement"""
-    import_line = lines[line_num - 1]
-    
-    # If it's the only import, remove the whole line
-    if import_line.count(',') == 0 and import_name in import_line:
-        # Check if single import
-        if re.match(rf"import\s+{{\s*{import_name}\s*}}", import_line):
-            return lines[:line_num-1] + lines[line_num:]
-        if re.match(rf"import\s+{import_name}\s+from", import_line):
-            return lines[:line_num-1] + lines[line_num:]
-    
-    # Remove from multi-import list
+@functools.lru_cache(maxsize=None)
+def _import_patterns(import_name: str) -> tuple[tuple[re.Pattern[str], ...], tuple[tuple[re.Pattern[str], str], ...]]:
+    """Compile the single-import and list-removal patterns for a name once"""
+    name = re.escape(import_name)
+    single = (
+        re.compile(rf"import\s+{{\s*{name}\s*}}"),
+        re.compile(rf"import\s+{name}\s+from"),
+    )
     # Handle: import { A, B, C } from
-    import_line = re.sub(rf',\s*{import_name}\s*,', ',', import_line)
-    import_line = re.sub(rf'{{\s*{import_name}\s*,', '{', import_line)
-    import_line = re.sub(rf',\s*{import_name}\s*}}', '}', import_line)
-    import_line = re.sub(rf'{{\s*{import_name}\s*}}', '{}', import_line)
+    removals = (
+        (re.compile(rf',\s*{name}\s*,'), ','),
+        (re.compile(rf'{{\s*{name}\s*,'), '{'),
+        (re.compile(rf',\s*{name}\s*}}'), '}'),
+        (re.compile(rf'{{\s*{name}\s*}}'), '{}'),
+    )
+    return single, removals
+
+def remove_unused_imports(lines: list[str], warnings: list[tuple[int, str]]) -> list[str]:
+    """Remove unused imports for (line_num, import_name) warnings in a single pass"""
+    to_delete: set[int] = set()
     
-    lines[line_num - 1] = import_line
-    return lines
+    for line_num, import_name in warnings:
+        index = line_num - 1
+        if index in to_delete:
+            continue
+        import_line = lines[index]
+        single, removals = _import_patterns(import_name)
+        
+        # If it's the only import, drop the whole line once all warnings are applied
+        if import_line.count(',') == 0 and import_name in import_line:
+            if any(pattern.match(import_line) for pattern in single):
+                to_delete.add(index)
+                continue
+        
+        # Remove from multi-import list
+        for pattern, replacement in removals:
+            import_line = pattern.sub(replacement, import_line)
+        lines[index] = import_line
+    
+    if not to_delete:
+        return lines
+    return [line for i, line in enumerate(lines) if i not in to_delete]
+
+def remove_unused_import(lines: list[str], import_name: str, line_num: int) -> list[str]:
+    """Remove unused import from import statement"""
+    return remove_unused_imports(lines, [(line_num, import_name)])
 
 def main():
     print("ESLint Warning Systematic Fixer")
@@ -17,6 +17,9 @@ export const providerRegistry: Record<string, LLMProvider> = {
   'grok': new GrokProvider()
 };
 
+// Registry keys never change after module load
+const PROVIDER_IDS: readonly string[] = Object.freeze(Object.keys(providerRegistry));
+
 // Get a provider by ID
 export function getProvider(providerId: string): LLMProvider | null {
   return providerRegistry[providerId] || null;
@@ -28,8 +31,8 @@ export function getAllProviders(): LLMProvider[] {
 }
 
 // Get provider IDs
-export function getProviderIds(): string[] {
-  return Object.keys(providerRegistry);
+export function getProviderIds(): readonly string[] {
+  return PROVIDER_IDS;
 }
 
 // Validate a provider configuration
@@ -2,7 +2,7 @@
 // This service handles communication with OpenAI's models
 
 import { LLMProvider, Message, ChatOptions } from '@/types/llm';
-import OpenAIService from './openai-service';
+import { getOpenAIService } from './openai-service';
 
 class OpenAIProvider implements LLMProvider {
   id = 'openai';
@@ -37,22 +37,13 @@ class OpenAIProvider implements LLMProvider {
     }
   ];
 
-  private service: OpenAIService | null = null;
-
-  private getService(apiKey: string): OpenAIService {
-    if (!this.service) {
-      this.service = new OpenAIService(apiKey);
-    }
-    return this.service;
-  }
-
   async validateConfig(config: { apiKey: string }): Promise<boolean> {
     try {
       if (!config.apiKey) {
         return false;
       }
       
-      const result = await this.getService(config.apiKey).testConnection(config.apiKey);
+      const result = await getOpenAIService(config.apiKey).testConnection(config.apiKey);
       return result.success;
     } catch (error) {
       console.error('OpenAI config validation error:', error);
@@ -75,7 +66,7 @@ class OpenAIProvider implements LLMProvider {
         throw new Error('API key is required');
       }
       
-      const response = await this.getService(options.apiKey).chat({
+      const response = await getOpenAIService(options.apiKey).chat({
         userId: options.userId || 'anonymous',
         provider: 'openai',
         messages: options.messages.map(m => ({
@@ -105,7 +96,7 @@ class OpenAIProvider implements LLMProvider {
         throw new Error('API key is required');
       }
       
-      const stream = this.getService(options.apiKey).streamChat({
+      const stream = getOpenAIService(options.apiKey).streamChat({
         userId: options.userId || 'anonymous',
         provider: 'openai',
         messages: options.messages.map(m => ({
@@ -42,11 +42,22 @@ interface OpenAIStreamChunk {
   }>
 }
 
+function buildRequestHeaders(apiKey: string): Record<string, string> {
+  return {
+    'Content-Type': 'application/json',
+    'Authorization': `Bearer ${apiKey}`,
+    'User-Agent': 'Personal-LLM-Tool/1.0',
+  }
+}
+
 class OpenAIService implements ILLMProvider {
   private baseUrl = 'https://api.openai.com/v1'
   private metadata: ProviderMetadata;
+  // Headers for this instance's key never change, so build them once
+  private readonly requestHeaders: Record<string, string>
 
   constructor(private apiKey: string) {
+    this.requestHeaders = buildRequestHeaders(apiKey)
     this.metadata = {
       id: 'openai',
       name: 'OpenAI',
@@ -162,11 +173,7 @@ class OpenAIService implements ILLMProvider {
 
       const response = await fetch(`${baseUrl}/chat/completions`, {
         method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'Authorization': `Bearer ${this.apiKey}`, // Use this.apiKey
-          'User-Agent': 'Personal-LLM-Tool/1.0',
-        },
+        headers: this.requestHeaders,
         body: JSON.stringify({
           model,
           messages: request.messages,
@@ -231,11 +238,7 @@ class OpenAIService implements ILLMProvider {
 
       const response = await fetch(`${effectiveBaseUrl}/chat/completions`, {
         method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'Authorization': `Bearer ${apiKey}`,
-          'User-Agent': 'Personal-LLM-Tool/1.0',
-        },
+        headers: apiKey === this.apiKey ? this.requestHeaders : buildRequestHeaders(apiKey),
         body: JSON.stringify({
           model,
           messages: request.messages,
@@ -352,5 +355,27 @@ class OpenAIService implements ILLMProvider {
   }
 }
 
+// Services are shared per API key so request headers are built once per key.
+// The cache is a small LRU: rotated or per-user keys age out instead of being
+// retained (with the plaintext key) for the lifetime of the process.
+const MAX_CACHED_SERVICES = 16;
+const serviceCache = new Map<string, OpenAIService>();
+
+export function getOpenAIService(apiKey: string): OpenAIService {
+  let service = serviceCache.get(apiKey);
+  if (service) {
+    // A key in active use moves to the back so eviction takes an idle key first
+    serviceCache.delete(apiKey);
+  } else {
+    service = new OpenAIService(apiKey);
+    if (serviceCache.size >= MAX_CACHED_SERVICES) {
+      const oldest = serviceCache.keys().next();
+      if (!oldest.done) serviceCache.delete(oldest.value);
+    }
+  }
+  serviceCache.set(apiKey, service);
+  return service;
+}
+
 // Single default export
 export default OpenAIService;
\ No newline at end of file
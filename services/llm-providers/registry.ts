@@ -6,7 +6,7 @@
  */
 
 import type { ILLMProvider, ProviderMetadata, ChatRequest, ChatChunk, ChatResponse, ModelInfo, ConnectionTestResult } from './base-provider'
-import OpenAIService from './openai-service'
+import { getOpenAIService } from './openai-service'
 
 // Lazy-loaded provider instances (singletons per API key)
 // Note: These should ideally be managed per user session or context,
@@ -242,9 +242,8 @@ const PROVIDER_METADATA: Record<string, ProviderMetadata> = {
 const PROVIDER_FACTORIES: Record<string, ProviderFactory> = {
   openai: {
     metadata: PROVIDER_METADATA.openai,
-    getInstance: async (apiKey: string) => {
-      return new OpenAIService(apiKey);
-    }
+    // Shared bounded per-key cache, see getOpenAIService
+    getInstance: async (apiKey: string) => getOpenAIService(apiKey)
   },
   anthropic: {
     metadata: PROVIDER_METADATA.anthropic,
@@ -292,6 +291,9 @@ const PROVIDER_FACTORIES: Record<string, ProviderFactory> = {
   }
 }
 
+// Factory keys never change after module load
+const PROVIDER_IDS: readonly string[] = Object.freeze(Object.keys(PROVIDER_FACTORIES))
+
 /**
  * Get provider instance by ID
  * @param providerId - Provider identifier (openai, anthropic, etc.)
@@ -316,8 +318,8 @@ export async function getProvider(providerId: string, apiKey: string): Promise<I
 /**
  * Get all available provider IDs
  */
-export function getProviderIds(): string[] {
-  return Object.keys(PROVIDER_FACTORIES)
+export function getProviderIds(): readonly string[] {
+  return PROVIDER_IDS
 }
 
 /**
@@ -167,33 +167,35 @@ async function fetchWithRetry(
   throw lastErr ?? new Error('Request failed')
 }
 
-function getNetworkDefaults(provider: string): { timeoutMs?: number; retries?: number } {
-  const readInt = (v?: string) => {
-    const n = v ? parseInt(v, 10) : NaN
-    return Number.isFinite(n) ? n : undefined
-  }
+const readInt = (v?: string) => {
+  const n = v ? parseInt(v, 10) : NaN
+  return Number.isFinite(n) ? n : undefined
+}
 
-  // Global env overrides
-  const globalTimeout = readInt(process.env.LLM_FETCH_TIMEOUT_MS)
-  const globalRetries = readInt(process.env.LLM_FETCH_RETRIES)
-
-  // Sensible per-provider defaults
-  const base: Record<string, { timeoutMs: number; retries: number }> = {
-    openai: { timeoutMs: 30000, retries: 1 },
-    claude: { timeoutMs: 45000, retries: 1 },
-    anthropic: { timeoutMs: 45000, retries: 1 },
-    google: { timeoutMs: 30000, retries: 1 },
-    'google-ai': { timeoutMs: 30000, retries: 1 },
-    openrouter: { timeoutMs: 35000, retries: 2 },
-    grok: { timeoutMs: 30000, retries: 1 },
-    github: { timeoutMs: 25000, retries: 0 },
-    llama: { timeoutMs: 15000, retries: 0 },
-  }
+// Global env overrides, resolved once at module load instead of on every request
+const GLOBAL_FETCH_TIMEOUT_MS = readInt(process.env.LLM_FETCH_TIMEOUT_MS)
+const GLOBAL_FETCH_RETRIES = readInt(process.env.LLM_FETCH_RETRIES)
+
+// Sensible per-provider defaults
+const PROVIDER_NETWORK_DEFAULTS: Record<string, { timeoutMs: number; retries: number }> = {
+  openai: { timeoutMs: 30000, retries: 1 },
+  claude: { timeoutMs: 45000, retries: 1 },
+  anthropic: { timeoutMs: 45000, retries: 1 },
+  google: { timeoutMs: 30000, retries: 1 },
+  'google-ai': { timeoutMs: 30000, retries: 1 },
+  openrouter: { timeoutMs: 35000, retries: 2 },
+  grok: { timeoutMs: 30000, retries: 1 },
+  github: { timeoutMs: 25000, retries: 0 },
+  llama: { timeoutMs: 15000, retries: 0 },
+}
+
+const FALLBACK_NETWORK_DEFAULTS = { timeoutMs: 30000, retries: 1 }
 
-  const d = base[provider] || { timeoutMs: 30000, retries: 1 }
+function getNetworkDefaults(provider: string): { timeoutMs?: number; retries?: number } {
+  const d = PROVIDER_NETWORK_DEFAULTS[provider] || FALLBACK_NETWORK_DEFAULTS
   return {
-    timeoutMs: globalTimeout ?? d.timeoutMs,
-    retries: globalRetries ?? d.retries,
+    timeoutMs: GLOBAL_FETCH_TIMEOUT_MS ?? d.timeoutMs,
+    retries: GLOBAL_FETCH_RETRIES ?? d.retries,
   }
 }
 
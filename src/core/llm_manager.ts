@@ -122,30 +122,44 @@ export class LLMManager {
         reject,
       };
       this.queue.push(task);
-      this.processQueue().catch((err) => {
-        // This should never happen; individual task errors are handled per task
-        console.error('LLMManager internal error:', err);
-      });
+      this.processQueue();
     });
   }
 
-  private async processQueue(): Promise<void> {
+  /**
+   * Starts queued tasks while concurrency slots are free.  Tasks are only
+   * started once a slot is available, and each settled task frees its slot
+   * and pulls the next one synchronously, so no intermediate promise chain is
+   * created per completion.
+   */
+  private processQueue(): void {
     while (this.running < this.concurrency && this.queue.length > 0) {
       const { fn, resolve, reject } = this.queue.shift() as Task<ProviderResponse>;
       this.running++;
-      fn().then((result) => {
-        this.running--;
-        resolve(result);
-        this.processQueue().catch((err) => {
-          console.error('LLMManager internal error:', err);
-        });
-      }).catch((error) => {
-        this.running--;
-        reject(error);
-        this.processQueue().catch((err) => {
-          console.error('LLMManager internal error:', err);
-        });
-      });
+      let pending: Promise<ProviderResponse>;
+      try {
+        pending = fn();
+      } catch (error) {
+        pending = Promise.reject(error);
+      }
+      pending.then(
+        (result) => {
+          this.running--;
+          // resolve maps the provider response and throws if it is missing;
+          // surface that to the caller instead of leaving invoke() pending
+          try {
+            resolve(result);
+          } catch (error) {
+            reject(error);
+          }
+          this.processQueue();
+        },
+        (error) => {
+          this.running--;
+          reject(error);
+          this.processQueue();
+        },
+      );
     }
   }
 }
\ No newline at end of file
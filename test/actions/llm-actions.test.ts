@@ -0,0 +1,59 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { LLMProviderError } from '@/lib/error-system';
+
+vi.mock('@/lib/prisma', () => ({
+  default: {},
+}));
+
+vi.mock('@/services/api-service', () => ({
+  sendChatMessage: vi.fn(),
+}));
+
+vi.mock('@/services/conversation-storage', () => ({
+  saveConversation: vi.fn(),
+  updateConversation: vi.fn(),
+}));
+
+import { sendMultiPrompt } from '@/app/actions/llm-actions';
+import { sendChatMessage } from '@/services/api-service';
+
+describe('sendMultiPrompt', () => {
+  const messages = [{ role: 'user' as const, content: 'Hello' }];
+
+  beforeEach(() => {
+    vi.mocked(sendChatMessage).mockReset();
+  });
+
+  it('should resolve with one message per provider when some providers fail', async () => {
+    vi.mocked(sendChatMessage).mockImplementation(async (provider: string) => {
+      if (provider === 'openai') {
+        return { role: 'assistant', content: 'Hi from openai', timestamp: 1 };
+      }
+      if (provider === 'anthropic') {
+        throw new LLMProviderError('anthropic', 'upstream 500: {"secret":"body"}', { endpoint: 'sendChatMessage' });
+      }
+      throw new Error('ECONNREFUSED 10.0.0.5:5432');
+    });
+
+    const results = await sendMultiPrompt(['openai', 'anthropic', 'google'], messages, {});
+
+    expect(results).toHaveLength(3);
+    expect(results[0].content).toBe('Hi from openai');
+
+    expect(results[1].metadata).toEqual({ provider: 'anthropic', error: true });
+    expect(results[1].content).toBe(
+      'Error: Error with anthropic provider. Please try again or switch providers.'
+    );
+
+    expect(results[2].metadata).toEqual({ provider: 'google', error: true });
+    expect(results[2].content).toBe('Error: Request failed. Please try again.');
+  });
+
+  it('should not expose internal error messages to the client', async () => {
+    vi.mocked(sendChatMessage).mockRejectedValue(new Error('ECONNREFUSED 10.0.0.5:5432'));
+
+    const [result] = await sendMultiPrompt(['openai'], messages, {});
+
+    expect(result.content).not.toContain('ECONNREFUSED');
+  });
+});
@@ -0,0 +1,77 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+
+const { deriveKey, aesGcmEncrypt, upsert } = vi.hoisted(() => ({
+  deriveKey: vi.fn(),
+  aesGcmEncrypt: vi.fn(),
+  upsert: vi.fn(),
+}));
+
+vi.mock('@/lib/crypto', () => ({
+  deriveKey,
+  aesGcmEncrypt,
+  aesGcmDecrypt: vi.fn(),
+}));
+
+vi.mock('@/lib/prisma', () => ({
+  default: { providerConfig: { upsert } },
+}));
+
+vi.mock('@/lib/logger', () => ({
+  default: { info: vi.fn(), warn: vi.fn(), error: vi.fn() },
+}));
+
+const SEED_A = 'a'.repeat(32);
+const SEED_B = 'b'.repeat(32);
+const API_KEY = 'sk-test-0123456789abcdef';
+
+async function loadService() {
+  vi.resetModules();
+  return import('@/lib/api-key-service');
+}
+
+describe('api-key-service encryption key', () => {
+  beforeEach(() => {
+    deriveKey.mockReset().mockImplementation(async (seed: string) => new TextEncoder().encode(seed));
+    aesGcmEncrypt.mockReset().mockResolvedValue('encrypted');
+    upsert.mockReset().mockResolvedValue({
+      id: 'cfg-1',
+      provider: 'openai',
+      isActive: true,
+      settings: null,
+      createdAt: new Date(),
+      updatedAt: new Date(),
+      usageCount: 0,
+      lastUsedAt: null,
+    });
+  });
+
+  afterEach(() => {
+    vi.unstubAllEnvs();
+  });
+
+  it('should derive the key once for repeated encryptions', async () => {
+    vi.stubEnv('API_KEY_ENCRYPTION_SEED', SEED_A);
+    const { storeUserApiKey } = await loadService();
+
+    await storeUserApiKey('user-1', 'openai', API_KEY);
+    await storeUserApiKey('user-2', 'openai', API_KEY);
+
+    expect(deriveKey).toHaveBeenCalledTimes(1);
+    expect(deriveKey).toHaveBeenCalledWith(SEED_A);
+    expect(aesGcmEncrypt).toHaveBeenCalledTimes(2);
+  });
+
+  it('should derive a new key when the seed changes', async () => {
+    vi.stubEnv('API_KEY_ENCRYPTION_SEED', SEED_A);
+    const { storeUserApiKey } = await loadService();
+    await storeUserApiKey('user-1', 'openai', API_KEY);
+
+    vi.stubEnv('API_KEY_ENCRYPTION_SEED', SEED_B);
+    await storeUserApiKey('user-1', 'openai', API_KEY);
+
+    expect(deriveKey).toHaveBeenCalledTimes(2);
+    expect(deriveKey).toHaveBeenLastCalledWith(SEED_B);
+    const lastKey = aesGcmEncrypt.mock.calls[1][0];
+    expect(new TextDecoder().decode(lastKey)).toBe(SEED_B);
+  });
+});
@@ -0,0 +1,59 @@
+import { describe, it, expect, vi } from 'vitest';
+
+vi.mock('@/lib/monitoring', () => ({
+  monitoring: { recordMetric: vi.fn() }
+}));
+
+vi.mock('@/lib/audit-logger', () => ({
+  auditLogger: { logSecurityEvent: vi.fn() }
+}));
+
+import { MemoryCache } from '@/lib/cache-enterprise';
+
+describe('MemoryCache', () => {
+  const createCache = (maxSize: number) => new MemoryCache({ ttl: 60000, maxSize });
+
+  it('should evict the least recently used key, counting reads as use', async () => {
+    const cache = createCache(3);
+    await cache.set('a', 1);
+    await cache.set('b', 2);
+    await cache.set('c', 3);
+
+    // Reading 'a' makes 'b' the least recently used
+    expect(await cache.get('a')).toBe(1);
+    await cache.set('d', 4);
+
+    expect(await cache.get('b')).toBeNull();
+    expect(await cache.get('a')).toBe(1);
+    expect(await cache.get('c')).toBe(3);
+    expect(await cache.get('d')).toBe(4);
+    expect(cache.getStats().evictions).toBe(1);
+  });
+
+  it('should not evict another key when overwriting at capacity', async () => {
+    const cache = createCache(2);
+    await cache.set('a', 1);
+    await cache.set('b', 2);
+
+    await cache.set('a', 10);
+
+    expect(await cache.get('a')).toBe(10);
+    expect(await cache.get('b')).toBe(2);
+    expect(cache.getStats().evictions).toBe(0);
+    expect(cache.getStats().size).toBe(2);
+  });
+
+  it('should never grow past maxSize', async () => {
+    const cache = createCache(5);
+
+    for (let i = 0; i < 50; i++) {
+      await cache.set(`key-${i}`, i);
+      expect(cache.getStats().size).toBeLessThanOrEqual(5);
+    }
+
+    expect(cache.getStats().size).toBe(5);
+    expect(cache.getStats().evictions).toBe(45);
+    expect(await cache.get('key-49')).toBe(49);
+    expect(await cache.get('key-44')).toBeNull();
+  });
+});
@@ -0,0 +1,224 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+
+const { findMany } = vi.hoisted(() => ({ findMany: vi.fn() }));
+
+vi.mock('@/lib/observability/logger', () => ({
+  logger: {
+    info: vi.fn(),
+    debug: vi.fn(),
+    warn: vi.fn(),
+    error: vi.fn()
+  }
+}));
+
+vi.mock('@/lib/observability/metrics', () => ({
+  metricsRegistry: {
+    registerGauge: vi.fn().mockReturnValue({ set: vi.fn() })
+  }
+}));
+
+vi.mock('@prisma/client', () => ({
+  PrismaClient: vi.fn().mockImplementation(() => ({
+    user: { findMany }
+  }))
+}));
+
+const PROCESSING_INTERVAL = 50;
+
+async function flushMicrotasks(): Promise<void> {
+  for (let i = 0; i < 20; i++) {
+    await Promise.resolve();
+  }
+}
+
+async function createMultiplexer(poolSize: number) {
+  vi.stubEnv('DB_POOL_SIZE', String(poolSize));
+  vi.resetModules();
+  const { dbMultiplexer } = await import('@/lib/database-connection-multiplexer');
+  return dbMultiplexer;
+}
+
+function queueFindMany(multiplexer: any, timeout?: number): Promise<any> {
+  return multiplexer.executeQuery('findMany', { model: 'user', args: {} }, 'medium', timeout);
+}
+
+describe('DatabaseConnectionMultiplexer', () => {
+  let pending: Array<(value: unknown) => void>;
+
+  beforeEach(() => {
+    vi.useFakeTimers();
+    pending = [];
+    findMany.mockReset();
+    findMany.mockImplementation(() => new Promise(resolve => pending.push(resolve)));
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+    vi.unstubAllEnvs();
+  });
+
+  describe('batch processing', () => {
+    it('should cap batch size by connection capacity', async () => {
+      const multiplexer = await createMultiplexer(2);
+
+      for (let i = 0; i < 5; i++) {
+        queueFindMany(multiplexer);
+      }
+
+      await vi.advanceTimersByTimeAsync(PROCESSING_INTERVAL);
+      await flushMicrotasks();
+
+      expect(findMany).toHaveBeenCalledTimes(2);
+      const stats = multiplexer.getStatistics();
+      expect(stats.queue.pendingQueries).toBe(3);
+      expect(stats.queue.batchesInProgress).toBe(1);
+      expect(stats.pool.busyConnections).toBe(2);
+
+      // No free connections: further ticks leave the queue alone
+      await vi.advanceTimersByTimeAsync(PROCESSING_INTERVAL);
+      await flushMicrotasks();
+      expect(findMany).toHaveBeenCalledTimes(2);
+    });
+
+    it('should not hand out a freshly created connection twice', async () => {
+      const multiplexer = await createMultiplexer(3) as any;
+
+      const connections = [
+        await multiplexer.getConnection(),
+        await multiplexer.getConnection(),
+        await multiplexer.getConnection()
+      ];
+
+      expect(new Set(connections).size).toBe(3);
+      expect(multiplexer.pool.totalConnections).toBe(3);
+      expect(multiplexer.pool.available).toHaveLength(0);
+    });
+
+    it('should remove completed batches from the in-progress queue', async () => {
+      const multiplexer = await createMultiplexer(2);
+
+      const results = [queueFindMany(multiplexer), queueFindMany(multiplexer)];
+      await vi.advanceTimersByTimeAsync(PROCESSING_INTERVAL);
+      await flushMicrotasks();
+      expect(multiplexer.getStatistics().queue.batchesInProgress).toBe(1);
+
+      pending.forEach((resolve, index) => resolve([{ id: index }]));
+      await flushMicrotasks();
+
+      await expect(Promise.all(results)).resolves.toEqual([[{ id: 0 }], [{ id: 1 }]]);
+      const stats = multiplexer.getStatistics();
+      expect(stats.queue.batchesInProgress).toBe(0);
+      expect(stats.pool.availableConnections).toBe(2);
+    });
+
+    it('should reject carved queries when building the batch fails', async () => {
+      const multiplexer = await createMultiplexer(2) as any;
+      vi.spyOn(multiplexer, 'determineBatchPriority').mockImplementation(() => {
+        throw new Error('priority failure');
+      });
+
+      const result = queueFindMany(multiplexer);
+      const assertion = expect(result).rejects.toThrow('priority failure');
+
+      await vi.advanceTimersByTimeAsync(PROCESSING_INTERVAL);
+      await assertion;
+      expect(multiplexer.getStatistics().queue.batchesInProgress).toBe(0);
+      expect(findMany).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('dispatch scheduling', () => {
+    it('should dispatch a full batch on the next microtask', async () => {
+      const multiplexer = await createMultiplexer(30);
+
+      for (let i = 0; i < 20; i++) {
+        queueFindMany(multiplexer);
+      }
+      expect(findMany).not.toHaveBeenCalled();
+
+      // No timer advance: the batch goes out as soon as it fills
+      await flushMicrotasks();
+      expect(findMany).toHaveBeenCalledTimes(20);
+      expect(multiplexer.getStatistics().queue.pendingQueries).toBe(0);
+    });
+
+    it('should dispatch a partial batch after the processing interval', async () => {
+      const multiplexer = await createMultiplexer(2);
+
+      queueFindMany(multiplexer);
+      await flushMicrotasks();
+      expect(findMany).not.toHaveBeenCalled();
+
+      await vi.advanceTimersByTimeAsync(PROCESSING_INTERVAL - 1);
+      await flushMicrotasks();
+      expect(findMany).not.toHaveBeenCalled();
+
+      await vi.advanceTimersByTimeAsync(1);
+      await flushMicrotasks();
+      expect(findMany).toHaveBeenCalledTimes(1);
+    });
+
+    it('should re-arm dispatch when a connection is released to waiting queries', async () => {
+      const multiplexer = await createMultiplexer(2);
+
+      for (let i = 0; i < 3; i++) {
+        queueFindMany(multiplexer);
+      }
+      await vi.advanceTimersByTimeAsync(PROCESSING_INTERVAL);
+      await flushMicrotasks();
+      expect(findMany).toHaveBeenCalledTimes(2);
+
+      // Nothing dispatches while the pool is exhausted...
+      await vi.advanceTimersByTimeAsync(PROCESSING_INTERVAL * 4);
+      await flushMicrotasks();
+      expect(findMany).toHaveBeenCalledTimes(2);
+
+      // ...until a finished query hands its connection back
+      pending[0]([]);
+      await flushMicrotasks();
+      await vi.advanceTimersByTimeAsync(PROCESSING_INTERVAL);
+      await flushMicrotasks();
+      expect(findMany).toHaveBeenCalledTimes(3);
+      expect(multiplexer.getStatistics().queue.pendingQueries).toBe(0);
+    });
+  });
+
+  describe('queue timeouts', () => {
+    it('should clear the queue timeout once the query is dispatched', async () => {
+      const multiplexer = await createMultiplexer(2);
+      // Metrics reporting keeps one interval alive for the multiplexer's lifetime
+      const baselineTimers = vi.getTimerCount();
+
+      const result = queueFindMany(multiplexer, 1000);
+      expect(vi.getTimerCount()).toBe(baselineTimers + 2); // dispatch window + query timeout
+
+      await vi.advanceTimersByTimeAsync(PROCESSING_INTERVAL);
+      await flushMicrotasks();
+      expect(findMany).toHaveBeenCalledTimes(1);
+      expect(vi.getTimerCount()).toBe(baselineTimers);
+
+      // A slow query is not failed by its (queue-only) timeout
+      await vi.advanceTimersByTimeAsync(2000);
+      pending[0]([{ id: 1 }]);
+      await expect(result).resolves.toEqual([{ id: 1 }]);
+    });
+
+    it('should reject a query that is still queued when its timeout fires', async () => {
+      const multiplexer = await createMultiplexer(2);
+
+      queueFindMany(multiplexer);
+      queueFindMany(multiplexer);
+      await vi.advanceTimersByTimeAsync(PROCESSING_INTERVAL);
+      await flushMicrotasks();
+
+      // Pool is exhausted, so this one stays queued
+      const result = queueFindMany(multiplexer, 100);
+      const assertion = expect(result).rejects.toThrow('Query timeout after 100ms');
+
+      await vi.advanceTimersByTimeAsync(100);
+      await assertion;
+      expect(multiplexer.getStatistics().queue.pendingQueries).toBe(0);
+      expect(findMany).toHaveBeenCalledTimes(2);
+    });
+  });
+});
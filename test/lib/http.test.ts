@@ -0,0 +1,77 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { fetchWithRetry, retryAfterMs } from '@/lib/http';
+
+function responseWith(status: number, retryAfter?: string): Response {
+  const headers = retryAfter ? { 'retry-after': retryAfter } : undefined;
+  return new Response(null, { status, headers });
+}
+
+describe('http', () => {
+  afterEach(() => {
+    vi.useRealTimers();
+    vi.unstubAllGlobals();
+  });
+
+  describe('retryAfterMs', () => {
+    it('should parse a delay in seconds', () => {
+      expect(retryAfterMs(responseWith(429, '3'))).toBe(3000);
+    });
+
+    it('should parse an HTTP date relative to now', () => {
+      vi.useFakeTimers();
+      vi.setSystemTime(new Date('2025-01-01T00:00:00Z'));
+
+      expect(retryAfterMs(responseWith(503, 'Wed, 01 Jan 2025 00:00:05 GMT'))).toBe(5000);
+      expect(retryAfterMs(responseWith(503, 'Tue, 31 Dec 2024 23:59:00 GMT'))).toBe(0);
+    });
+
+    it('should return null for a missing or invalid header', () => {
+      expect(retryAfterMs(responseWith(429))).toBeNull();
+      expect(retryAfterMs(responseWith(429, 'soon'))).toBeNull();
+    });
+  });
+
+  describe('fetchWithRetry', () => {
+    it('should return the response when Retry-After exceeds the 10s cap', async () => {
+      const fetchMock = vi.fn().mockResolvedValue(responseWith(429, '30'));
+      vi.stubGlobal('fetch', fetchMock);
+
+      const response = await fetchWithRetry('https://example.com', { retries: 2 });
+
+      expect(response.status).toBe(429);
+      expect(fetchMock).toHaveBeenCalledTimes(1);
+    });
+
+    it('should wait for Retry-After before retrying a 429', async () => {
+      vi.useFakeTimers();
+      const fetchMock = vi
+        .fn()
+        .mockResolvedValueOnce(responseWith(429, '2'))
+        .mockResolvedValueOnce(responseWith(200));
+      vi.stubGlobal('fetch', fetchMock);
+
+      const pending = fetchWithRetry('https://example.com', { retries: 1, retryDelayMs: 10 });
+
+      await vi.advanceTimersByTimeAsync(1999);
+      expect(fetchMock).toHaveBeenCalledTimes(1);
+
+      await vi.advanceTimersByTimeAsync(1);
+      const response = await pending;
+      expect(response.status).toBe(200);
+      expect(fetchMock).toHaveBeenCalledTimes(2);
+    });
+
+    it('should ignore Retry-After on statuses other than 429/503', async () => {
+      const fetchMock = vi
+        .fn()
+        .mockResolvedValueOnce(responseWith(500, '30'))
+        .mockResolvedValueOnce(responseWith(200));
+      vi.stubGlobal('fetch', fetchMock);
+
+      const response = await fetchWithRetry('https://example.com', { retries: 1, retryDelayMs: 0 });
+
+      expect(response.status).toBe(200);
+      expect(fetchMock).toHaveBeenCalledTimes(2);
+    });
+  });
+});
@@ -0,0 +1,70 @@
+import { describe, it, expect, vi } from 'vitest';
+import { LLMManager, type Provider, type ProviderResponse } from '@/src/core/llm_manager';
+
+function deferred<T>() {
+  let resolve!: (value: T) => void;
+  const promise = new Promise<T>(r => { resolve = r; });
+  return { promise, resolve };
+}
+
+async function flushMicrotasks(): Promise<void> {
+  for (let i = 0; i < 10; i++) {
+    await Promise.resolve();
+  }
+}
+
+describe('LLMManager (core)', () => {
+  it('should start the next task only after the running one settles', async () => {
+    const manager = new LLMManager({ concurrency: 1 });
+    const first = deferred<ProviderResponse>();
+    const sendMessage = vi
+      .fn<Provider['sendMessage']>()
+      .mockReturnValueOnce(first.promise)
+      .mockResolvedValueOnce({ text: 'second' });
+    manager.registerProvider({ id: 'test', sendMessage });
+
+    const firstResult = manager.invoke('test', 'one');
+    const secondResult = manager.invoke('test', 'two');
+    await flushMicrotasks();
+
+    expect(sendMessage).toHaveBeenCalledTimes(1);
+
+    first.resolve({ text: 'first' });
+    await expect(firstResult).resolves.toBe('first');
+    await expect(secondResult).resolves.toBe('second');
+    expect(sendMessage).toHaveBeenCalledTimes(2);
+    expect(sendMessage.mock.calls[1][0]).toBe('two');
+  });
+
+  it('should reject the caller of a synchronously throwing provider and keep draining the queue', async () => {
+    const manager = new LLMManager({ concurrency: 1 });
+    manager.registerProvider({
+      id: 'broken',
+      sendMessage: () => {
+        throw new Error('sync failure');
+      },
+    });
+    manager.registerProvider({ id: 'ok', sendMessage: async () => ({ text: 'fine' }) });
+
+    const failed = manager.invoke('broken', 'hi');
+    const next = manager.invoke('ok', 'hi');
+
+    await expect(failed).rejects.toThrow('sync failure');
+    await expect(next).resolves.toBe('fine');
+  });
+
+  it('should reject invoke() when the provider resolves to nothing', async () => {
+    const manager = new LLMManager({ concurrency: 1 });
+    manager.registerProvider({
+      id: 'empty',
+      sendMessage: async () => undefined as unknown as ProviderResponse,
+    });
+    manager.registerProvider({ id: 'ok', sendMessage: async () => ({ text: 'fine' }) });
+
+    const failed = manager.invoke('empty', 'hi');
+    const next = manager.invoke('ok', 'hi');
+
+    await expect(failed).rejects.toBeInstanceOf(TypeError);
+    await expect(next).resolves.toBe('fine');
+  });
+});
@@ -0,0 +1,61 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+const { getInstance, chat, streamChat } = vi.hoisted(() => ({
+  getInstance: vi.fn(),
+  chat: vi.fn(),
+  streamChat: vi.fn(),
+}));
+
+vi.mock('@/services/llm-providers/registry', () => ({
+  providerRegistry: {
+    getAll: () => [{ metadata: { id: 'stub' }, getInstance }],
+  },
+}));
+
+import { invokeLLM } from '@/lib/llm-manager-instance';
+
+const messages = [{ role: 'user', content: 'Hello' }];
+const options = { userId: 'user-1', apiKey: 'sk-caller-key' };
+
+describe('invokeLLM', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    getInstance.mockResolvedValue({ chat, streamChat });
+  });
+
+  it('should resolve the provider service with the caller API key', async () => {
+    chat.mockResolvedValue({ content: 'ok' });
+
+    await invokeLLM('stub', messages, options);
+
+    expect(getInstance).toHaveBeenCalledWith('sk-caller-key');
+    expect(chat).toHaveBeenCalledWith(
+      expect.objectContaining({ userId: 'user-1', provider: 'stub' }),
+      'sk-caller-key'
+    );
+  });
+
+  it('should return the chat content as text', async () => {
+    chat.mockResolvedValue({ content: 'Hi there' });
+
+    await expect(invokeLLM('stub', messages, options)).resolves.toBe('Hi there');
+  });
+
+  it('should yield only non-empty chunk content when streaming', async () => {
+    streamChat.mockImplementation(async function* () {
+      yield { content: 'Hel' };
+      yield { content: '' };
+      yield { finishReason: 'stop' };
+      yield { content: 'lo' };
+    });
+
+    const stream = (await invokeLLM('stub', messages, { ...options, stream: true })) as AsyncGenerator<string>;
+    const chunks: string[] = [];
+    for await (const chunk of stream) {
+      chunks.push(chunk);
+    }
+
+    expect(chunks).toEqual(['Hel', 'lo']);
+    expect(chat).not.toHaveBeenCalled();
+  });
+});
@@ -0,0 +1,28 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+
+async function loadLogger(level: string) {
+  vi.stubEnv('LOG_LEVEL', level);
+  vi.resetModules();
+  const { default: logger } = await import('@/lib/logger');
+  return logger;
+}
+
+describe('logger', () => {
+  afterEach(() => {
+    vi.restoreAllMocks();
+    vi.unstubAllEnvs();
+  });
+
+  it('should drop entries below LOG_LEVEL', async () => {
+    const log = vi.spyOn(console, 'log').mockImplementation(() => {});
+    const warn = vi.spyOn(console, 'warn').mockImplementation(() => {});
+    const logger = await loadLogger('warn');
+
+    logger.info('filtered out');
+    logger.warn('kept');
+
+    expect(log).not.toHaveBeenCalled();
+    expect(warn).toHaveBeenCalledTimes(1);
+    expect(JSON.parse(warn.mock.calls[0][0])).toMatchObject({ level: 'WARN', message: 'kept' });
+  });
+});
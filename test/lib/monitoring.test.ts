@@ -0,0 +1,56 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+
+vi.mock('@/lib/prisma', () => ({
+  default: { $queryRaw: vi.fn().mockResolvedValue([{ '1': 1 }]) },
+}));
+
+vi.mock('@/lib/audit-logger', () => ({
+  auditLogger: { logSecurityEvent: vi.fn() },
+}));
+
+vi.mock('@/lib/rate-limiter-enterprise', () => ({
+  enterpriseRateLimiter: { getStatus: vi.fn().mockResolvedValue({ redis: false }) },
+}));
+
+import { monitoring } from '@/lib/monitoring';
+
+describe('monitoring health checks', () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  // Runs first: later tests register checks on the shared singleton
+  it('should clear each timeout timer once its check settles', async () => {
+    const baselineTimers = vi.getTimerCount();
+
+    const report = await monitoring.runHealthChecks(true);
+
+    expect(report.checks.length).toBeGreaterThan(0);
+    expect(vi.getTimerCount()).toBe(baselineTimers);
+  });
+
+  it('should run checks concurrently so hung checks share one timeout', async () => {
+    const baselineTimers = vi.getTimerCount();
+    monitoring.registerHealthCheck('hung-a', () => new Promise(() => {}));
+    monitoring.registerHealthCheck('hung-b', () => new Promise(() => {}));
+
+    const pending = monitoring.runHealthChecks(true);
+    await vi.advanceTimersByTimeAsync(5000);
+    const report = await pending;
+
+    for (const name of ['hung-a', 'hung-b']) {
+      const check = report.checks.find(c => c.name === name);
+      expect(check).toMatchObject({
+        status: 'unhealthy',
+        message: 'Health check timeout',
+        responseTime: 5000,
+      });
+    }
+    expect(report.status).toBe('unhealthy');
+    expect(vi.getTimerCount()).toBe(baselineTimers);
+  });
+});
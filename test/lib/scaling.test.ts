@@ -244,6 +244,24 @@ describe('Scaling Infrastructure', () => {
       
       expect(exported).toContain('realmultillm_prometheus_test{service="api"} 456');
     });
+
+    it('should reuse a recent health report instead of re-running checks', async () => {
+      const runCheck = vi
+        .spyOn(monitoring as any, 'runHealthCheck')
+        .mockImplementation(async (name: any) => ({ name, status: 'healthy' }));
+
+      const first = await monitoring.runHealthChecks();
+      const checkCount = runCheck.mock.calls.length;
+      const second = await monitoring.runHealthChecks();
+
+      expect(second).toBe(first);
+      expect(runCheck).toHaveBeenCalledTimes(checkCount);
+
+      await monitoring.runHealthChecks(true);
+      expect(runCheck).toHaveBeenCalledTimes(checkCount * 2);
+
+      runCheck.mockRestore();
+    });
   });
 
   describe('Integration Tests', () => {
@@ -243,6 +243,76 @@ describe('PHASE 3 SCALABILITY: Advanced Request Routing', () => {
     expect(stats.routing).toHaveProperty('averageRoutingTime');
     expect(Array.isArray(stats.strategies)).toBe(true);
   });
+
+  describe('least connections (power of two choices)', () => {
+    const context = { provider: 'p2c', priority: 'medium' as const };
+
+    const endpoint = (id: string, utilizationPercent: number, healthStatus = 'healthy') => ({
+      id,
+      provider: 'p2c',
+      weight: 100,
+      healthStatus,
+      capacity: { current: utilizationPercent, maximum: 100, utilizationPercent },
+      performance: { averageResponseTime: 0, errorRate: 0, successRate: 100, requestCount: 0 },
+      lastHealthCheck: Date.now(),
+      consecutiveFailures: 0
+    });
+
+    const select = async (endpoints: any[]) => {
+      const { requestRouter } = await import('@/lib/advanced-request-router');
+      return (requestRouter as any).selectLeastConnections(endpoints, context);
+    };
+
+    // Samples indices 0 and 2 out of three endpoints
+    const sampleFirstAndLast = () =>
+      vi.spyOn(Math, 'random').mockReturnValueOnce(0).mockReturnValueOnce(0.5);
+
+    afterEach(() => {
+      vi.restoreAllMocks();
+    });
+
+    it('should pick the less utilized of the two sampled endpoints', async () => {
+      sampleFirstAndLast();
+
+      const selected = await select([endpoint('a', 80), endpoint('b', 0), endpoint('c', 20)]);
+
+      // 'b' is the global minimum but was not sampled
+      expect(selected.id).toBe('c');
+    });
+
+    it('should prefer a healthy sample over a less utilized degraded one', async () => {
+      sampleFirstAndLast();
+
+      const selected = await select([
+        endpoint('a', 0, 'degraded'),
+        endpoint('b', 10),
+        endpoint('c', 50)
+      ]);
+
+      expect(selected.id).toBe('c');
+    });
+
+    it('should fall back to a healthy endpoint when both samples are degraded', async () => {
+      sampleFirstAndLast();
+
+      const selected = await select([
+        endpoint('a', 0, 'degraded'),
+        endpoint('b', 90),
+        endpoint('c', 10, 'degraded')
+      ]);
+
+      expect(selected.id).toBe('b');
+    });
+
+    it('should return a single endpoint without sampling', async () => {
+      const random = vi.spyOn(Math, 'random');
+
+      const selected = await select([endpoint('only', 99, 'degraded')]);
+
+      expect(selected.id).toBe('only');
+      expect(random).not.toHaveBeenCalled();
+    });
+  });
 });
 
 describe('PHASE 3 SCALABILITY: Database Connection Multiplexing', () => {
@@ -0,0 +1,28 @@
+import { describe, it, expect, vi } from 'vitest';
+
+vi.mock('@/lib/prisma', () => ({
+  default: {},
+}));
+
+import { getOpenAIService } from '@/services/llm-providers/openai-service';
+
+describe('getOpenAIService', () => {
+  it('should reuse the service for the same API key', () => {
+    expect(getOpenAIService('sk-reuse-a')).toBe(getOpenAIService('sk-reuse-a'));
+    expect(getOpenAIService('sk-reuse-a')).not.toBe(getOpenAIService('sk-reuse-b'));
+  });
+
+  it('should drop the least recently used key once the cache is full', () => {
+    const first = getOpenAIService('sk-lru-0');
+    const second = getOpenAIService('sk-lru-1');
+
+    for (let i = 2; i < 17; i++) {
+      getOpenAIService(`sk-lru-${i}`);
+      // Keep the first key recently used
+      getOpenAIService('sk-lru-0');
+    }
+
+    expect(getOpenAIService('sk-lru-0')).toBe(first);
+    expect(getOpenAIService('sk-lru-1')).not.toBe(second);
+  });
+});